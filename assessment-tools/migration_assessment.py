@@ -2,9 +2,112 @@
 # Author: Srikar Ande - IBM Champion & Solution Architect
 # Purpose: Automated assessment of Maximo to MAS migration complexity
 
-import json
-import pandas as pd
+import functools
+import sys
+import numpy as np
 from datetime import datetime
+from types import MappingProxyType
+
+# Response keys per assessment category, in scoring order
+ORG_KEYS = ('independent_budget', 'decision_timeline', 'division_priorities', 'outcome_ownership')
+TECH_KEYS = ('integration_needs', 'data_control', 'security_complexity', 'custom_workflows')
+TIMELINE_KEYS = ('market_pressure', 'regulatory_timeline', 'strategic_timing', 'delay_sensitivity')
+RESOURCE_KEYS = ('team_availability', 'budget_flexibility', 'vendor_access', 'internal_capability')
+RISK_KEYS = ('failure_tolerance', 'downtime_sensitivity', 'upgrade_flexibility', 'dependency_risk')
+
+# Column layout of a flat 20-element response vector
+ALL_KEYS = ORG_KEYS + TECH_KEYS + TIMELINE_KEYS + RESOURCE_KEYS + RISK_KEYS
+
+# Score band boundaries; a score's band is the number of boundaries it meets
+_THRESHOLDS = np.array([4.0, 6.0, 7.5])
+
+# Category recommendation text per score band (below 6.0 shares one text)
+_ORG_TEXTS = (
+    "Current autonomy requirements may be met through enterprise integration",
+    "Current autonomy requirements may be met through enterprise integration",
+    "Moderate autonomy needs support separate instance consideration",
+    "High autonomy requirements strongly favor separate instance deployment"
+)
+_TECH_TEXTS = (
+    "Technical requirements may benefit from shared enterprise infrastructure",
+    "Technical requirements may benefit from shared enterprise infrastructure",
+    "Technical complexity moderate - evaluate integration vs. independence trade-offs",
+    "Technical factors strongly support simplified separate instance architecture"
+)
+_TIMELINE_TEXTS = (
+    "Timeline flexibility allows for coordinated enterprise implementation",
+    "Timeline flexibility allows for coordinated enterprise implementation",
+    "Timeline considerations support separate instance for faster delivery",
+    "Critical timeline requirements strongly favor accelerated separate instance approach"
+)
+_RESOURCE_TEXTS = (
+    "Resource constraints may benefit from shared enterprise approach",
+    "Resource constraints may benefit from shared enterprise approach",
+    "Adequate resources available for separate instance approach",
+    "Strong resource availability enables dedicated separate instance implementation"
+)
+_RISK_TEXTS = (
+    "Risk tolerance may accommodate enterprise coordination requirements",
+    "Risk tolerance may accommodate enterprise coordination requirements",
+    "Risk considerations favor separate instance for reduced dependencies",
+    "Risk profile strongly supports independent implementation approach"
+)
+
+# Overall (recommendation, confidence, rationale) per score band
+_OVERALL_OUTCOMES = (
+    ("ENTERPRISE_INTEGRATION_RECOMMENDED", "MEDIUM",
+     "Current factors suggest enterprise integration approach may provide better alignment with organizational needs."),
+    ("HYBRID_EVALUATION_REQUIRED", "MEDIUM",
+     "Mixed factors require detailed analysis of specific organizational priorities and constraints."),
+    ("SEPARATE_INSTANCE_RECOMMENDED", "MEDIUM",
+     "Several factors favor separate instance approach, though some considerations may benefit from additional evaluation."),
+    ("SEPARATE_INSTANCE_STRONGLY_RECOMMENDED", "HIGH",
+     "Multiple factors strongly favor separate instance deployment for operational independence and accelerated delivery.")
+)
+
+def _score_band(score):
+    # NaN fails every threshold comparison, so it belongs in the lowest band
+    if np.isnan(score):
+        return 0
+    return int(np.searchsorted(_THRESHOLDS, score, side='right'))
+
+@functools.lru_cache(maxsize=1024)
+def _score(response_tuple, weight_tuple):
+    composite = np.array(response_tuple, dtype=np.float64).reshape(5, 4).mean(axis=1)
+    return tuple(composite.tolist()), float(composite @ np.array(weight_tuple))
+
+def _assess_kernel_numpy(R, W):
+    out_c = R.reshape(-1, 5, 4).mean(axis=2)
+    return out_c, out_c @ W
+
+@functools.lru_cache(maxsize=None)
+def _get_kernel():
+    # Numba is optional and slow to import, so load it on first batch use
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return _assess_kernel_numpy
+    
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _assess_kernel(R, W):
+        N = R.shape[0]
+        out_c = np.empty((N, 5))
+        out_w = np.empty(N)
+        for i in prange(N):
+            s0 = (R[i, 0] + R[i, 1] + R[i, 2] + R[i, 3]) * 0.25
+            s1 = (R[i, 4] + R[i, 5] + R[i, 6] + R[i, 7]) * 0.25
+            s2 = (R[i, 8] + R[i, 9] + R[i, 10] + R[i, 11]) * 0.25
+            s3 = (R[i, 12] + R[i, 13] + R[i, 14] + R[i, 15]) * 0.25
+            s4 = (R[i, 16] + R[i, 17] + R[i, 18] + R[i, 19]) * 0.25
+            out_c[i, 0] = s0
+            out_c[i, 1] = s1
+            out_c[i, 2] = s2
+            out_c[i, 3] = s3
+            out_c[i, 4] = s4
+            out_w[i] = s0 * W[0] + s1 * W[1] + s2 * W[2] + s3 * W[3] + s4 * W[4]
+        return out_c, out_w
+    
+    return _assess_kernel
 
 class MigrationAssessment:
     """
@@ -12,15 +115,192 @@ class MigrationAssessment:
     Evaluates organizational, technical, and operational readiness factors.
     """
     
-    def __init__(self):
+    # Assessment categories, in score matrix row order
+    _CATEGORIES = ('organizational', 'technical', 'timeline', 'resource', 'risk')
+    
+    # Response keys for each category (one row per category)
+    _CATEGORY_KEYS = (ORG_KEYS, TECH_KEYS, TIMELINE_KEYS, RESOURCE_KEYS, RISK_KEYS)
+    
+    # Recommendation texts for each category, aligned with _CATEGORIES
+    _CATEGORY_TEXTS = (_ORG_TEXTS, _TECH_TEXTS, _TIMELINE_TEXTS, _RESOURCE_TEXTS, _RISK_TEXTS)
+    
+    # Reported factor names, aligned with _CATEGORY_KEYS
+    _FACTOR_NAMES = (
+        ('budget_control', 'decision_speed', 'strategic_alignment', 'performance_accountability'),
+        ('integration_complexity', 'data_sovereignty', 'security_requirements', 'customization_level'),
+        ('business_urgency', 'compliance_deadlines', 'competitive_advantage', 'disruption_tolerance'),
+        ('dedicated_team', 'funding_model', 'vendor_relationship', 'expertise_level'),
+        ('implementation_risk', 'operational_disruption', 'technology_obsolescence', 'coordination_complexity')
+    )
+    
+    # Default category weights, shared by all instances
+    DEFAULT_WEIGHTS = MappingProxyType({
+        'organizational_autonomy': 0.25,
+        'technical_complexity': 0.20,
+        'timeline_criticality': 0.20,
+        'resource_availability': 0.15,
+        'risk_tolerance': 0.20
+    })
+    
+    # Weight keys, aligned with _CATEGORIES
+    _WEIGHT_KEYS = (
+        'organizational_autonomy',
+        'technical_complexity',
+        'timeline_criticality',
+        'resource_availability',
+        'risk_tolerance'
+    )
+    
+    # Next steps per overall recommendation
+    _NEXT_STEPS = MappingProxyType({
+        'SEPARATE_INSTANCE_STRONGLY_RECOMMENDED': (
+            "Proceed with separate instance architecture planning",
+            "Develop SOW amendment for scope redefinition",
+            "Create dedicated project timeline and resource plan",
+            "Establish independent vendor relationship framework"
+        ),
+        'SEPARATE_INSTANCE_RECOMMENDED': (
+            "Conduct detailed cost-benefit analysis comparing approaches", 
+            "Validate resource availability and timeline requirements",
+            "Develop risk mitigation strategies for independent implementation",
+            "Engage stakeholders for deployment approach confirmation"
+        ),
+        'HYBRID_EVALUATION_REQUIRED': (
+            "Perform detailed stakeholder requirements analysis",
+            "Conduct pilot evaluation of both approaches",
+            "Develop comparative implementation scenarios",
+            "Schedule decision workshop with key stakeholders"
+        ),
+        'ENTERPRISE_INTEGRATION_RECOMMENDED': (
+            "Develop enterprise integration timeline and coordination plan",
+            "Establish shared governance and decision-making framework", 
+            "Create multi-divisional communication and change management strategy",
+            "Define shared infrastructure requirements and dependencies"
+        )
+    })
+    
+    _DEFAULT_STEPS = ("Contact IBM Champion community for guidance",)
+    
+    def __init__(self, weights=None):
+        """
+        Args:
+            weights (dict): Optional category weights overriding DEFAULT_WEIGHTS
+        """
+        
+        weights = dict(self.DEFAULT_WEIGHTS, **(weights or {}))
+        unknown = set(weights) - set(self._WEIGHT_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown weight keys: {', '.join(sorted(unknown))}")
+        
         self.assessment_data = {}
-        self.weights = {
-            'organizational_autonomy': 0.25,
-            'technical_complexity': 0.20,
-            'timeline_criticality': 0.20,
-            'resource_availability': 0.15,
-            'risk_tolerance': 0.20
+        self.weights = MappingProxyType(weights)
+        self._weight_vec = np.fromiter(
+            (self.weights[key] for key in self._WEIGHT_KEYS),
+            dtype=np.float64,
+            count=len(self._WEIGHT_KEYS)
+        )
+    
+    def score(self, response_tuple):
+        """
+        Score a flat response set, memoized on the responses and weights.
+        
+        Args:
+            response_tuple (tuple): 20 scores laid out as ALL_KEYS
+            
+        Returns:
+            tuple: (5 category composite scores, weighted score)
+        """
+        
+        return _score(tuple(response_tuple), tuple(self._weight_vec.tolist()))
+    
+    def invalidate_cache(self):
+        """
+        Discard memoized scores to release memory.
+        
+        Entries are keyed on the weight values in use at call time, so
+        changing weights never returns stale scores and needs no invalidation.
+        """
+        
+        _score.cache_clear()
+    
+    def assess_all(self, responses):
+        """
+        Score all five categories and the overall recommendation in one pass.
+        
+        Args:
+            responses (dict): Assessment responses keyed by category name
+            
+        Returns:
+            tuple: (per-category results dict, overall recommendation dict)
+        """
+        
+        composite, weighted_score = self.score(self.response_vector(responses).tolist())
+        
+        results = {
+            category: self._category_result(i, responses.get(category, {}), composite[i])
+            for i, category in enumerate(self._CATEGORIES)
         }
+        
+        return results, self._overall_recommendation(weighted_score)
+    
+    def assess_batch(self, responses_array):
+        """
+        Score many response sets at once.
+        
+        Args:
+            responses_array (np.ndarray): (N, 20) scores laid out as ALL_KEYS
+            
+        Returns:
+            np.ndarray: (N, 5) composite scores, one column per category
+        """
+        
+        return self.assess_many(responses_array)[0]
+    
+    def assess_many(self, responses_array, weights=None):
+        """
+        Score many response sets and their weighted totals in one pass.
+        
+        Uses a compiled Numba kernel when numba is installed.
+        
+        Args:
+            responses_array (np.ndarray): (N, 20) scores laid out as ALL_KEYS
+            weights (np.ndarray): Optional 5 category weights; defaults to the framework weights
+            
+        Returns:
+            tuple: ((N, 5) composite scores, (N,) weighted scores)
+            
+        Raises:
+            ValueError: If responses_array or weights has the wrong shape
+        """
+        
+        R = np.ascontiguousarray(np.atleast_2d(responses_array), dtype=np.float64)
+        if R.ndim != 2 or R.shape[1] != len(ALL_KEYS):
+            raise ValueError(f"responses_array must have shape (N, {len(ALL_KEYS)}), got {R.shape}")
+        
+        W = self._weight_vec if weights is None else np.ascontiguousarray(weights, dtype=np.float64)
+        if W.shape != (len(self._CATEGORIES),):
+            raise ValueError(f"weights must have shape ({len(self._CATEGORIES)},), got {W.shape}")
+        
+        return _get_kernel()(R, W)
+    
+    def response_vector(self, responses):
+        """
+        Flatten nested category responses into a single score vector.
+        
+        Args:
+            responses (dict): Assessment responses keyed by category name
+            
+        Returns:
+            np.ndarray: 20 scores laid out as ALL_KEYS
+        """
+        
+        return np.fromiter(
+            (responses.get(category, {}).get(key, 0)
+             for category, keys in zip(self._CATEGORIES, self._CATEGORY_KEYS)
+             for key in keys),
+            dtype=np.float64,
+            count=len(ALL_KEYS)
+        )
     
     def organizational_assessment(self, responses):
         """
@@ -33,20 +313,7 @@ class MigrationAssessment:
             dict: Scored organizational factors
         """
         
-        factors = {
-            'budget_control': responses.get('independent_budget', 0),
-            'decision_speed': responses.get('decision_timeline', 0),  
-            'strategic_alignment': responses.get('division_priorities', 0),
-            'performance_accountability': responses.get('outcome_ownership', 0)
-        }
-        
-        org_score = sum(factors.values()) / len(factors)
-        
-        return {
-            'factors': factors,
-            'composite_score': org_score,
-            'recommendation': self._get_org_recommendation(org_score)
-        }
+        return self._category_assessment(0, responses)
     
     def technical_assessment(self, responses):
         """
@@ -59,20 +326,7 @@ class MigrationAssessment:
             dict: Scored technical factors
         """
         
-        factors = {
-            'integration_complexity': responses.get('integration_needs', 0),
-            'data_sovereignty': responses.get('data_control', 0),
-            'security_requirements': responses.get('security_complexity', 0),
-            'customization_level': responses.get('custom_workflows', 0)
-        }
-        
-        tech_score = sum(factors.values()) / len(factors)
-        
-        return {
-            'factors': factors,
-            'composite_score': tech_score,
-            'recommendation': self._get_tech_recommendation(tech_score)
-        }
+        return self._category_assessment(1, responses)
     
     def timeline_assessment(self, responses):
         """
@@ -85,20 +339,7 @@ class MigrationAssessment:
             dict: Scored timeline factors
         """
         
-        factors = {
-            'business_urgency': responses.get('market_pressure', 0),
-            'compliance_deadlines': responses.get('regulatory_timeline', 0),
-            'competitive_advantage': responses.get('strategic_timing', 0),
-            'disruption_tolerance': responses.get('delay_sensitivity', 0)
-        }
-        
-        timeline_score = sum(factors.values()) / len(factors)
-        
-        return {
-            'factors': factors,
-            'composite_score': timeline_score,
-            'recommendation': self._get_timeline_recommendation(timeline_score)
-        }
+        return self._category_assessment(2, responses)
     
     def resource_assessment(self, responses):
         """
@@ -111,20 +352,7 @@ class MigrationAssessment:
             dict: Scored resource factors
         """
         
-        factors = {
-            'dedicated_team': responses.get('team_availability', 0),
-            'funding_model': responses.get('budget_flexibility', 0),
-            'vendor_relationship': responses.get('vendor_access', 0),
-            'expertise_level': responses.get('internal_capability', 0)
-        }
-        
-        resource_score = sum(factors.values()) / len(factors)
-        
-        return {
-            'factors': factors,
-            'composite_score': resource_score,
-            'recommendation': self._get_resource_recommendation(resource_score)
-        }
+        return self._category_assessment(3, responses)
     
     def risk_assessment(self, responses):
         """
@@ -137,19 +365,26 @@ class MigrationAssessment:
             dict: Scored risk factors
         """
         
+        return self._category_assessment(4, responses)
+    
+    def _category_assessment(self, index, responses):
+        scores = np.fromiter(
+            (responses.get(key, 0) for key in self._CATEGORY_KEYS[index]),
+            dtype=np.float64,
+            count=4
+        )
+        return self._category_result(index, responses, float(scores.mean()))
+    
+    def _category_result(self, index, responses, composite_score):
         factors = {
-            'implementation_risk': responses.get('failure_tolerance', 0),
-            'operational_disruption': responses.get('downtime_sensitivity', 0),
-            'technology_obsolescence': responses.get('upgrade_flexibility', 0),
-            'coordination_complexity': responses.get('dependency_risk', 0)
+            name: responses.get(key, 0)
+            for name, key in zip(self._FACTOR_NAMES[index], self._CATEGORY_KEYS[index])
         }
         
-        risk_score = sum(factors.values()) / len(factors)
-        
         return {
             'factors': factors,
-            'composite_score': risk_score,
-            'recommendation': self._get_risk_recommendation(risk_score)
+            'composite_score': composite_score,
+            'recommendation': self._CATEGORY_TEXTS[index][_score_band(composite_score)]
         }
     
     def calculate_overall_recommendation(self, assessment_results):
@@ -163,30 +398,17 @@ class MigrationAssessment:
             dict: Overall recommendation with confidence score
         """
         
-        weighted_score = (
-            assessment_results['organizational']['composite_score'] * self.weights['organizational_autonomy'] +
-            assessment_results['technical']['composite_score'] * self.weights['technical_complexity'] +
-            assessment_results['timeline']['composite_score'] * self.weights['timeline_criticality'] +
-            assessment_results['resource']['composite_score'] * self.weights['resource_availability'] +
-            assessment_results['risk']['composite_score'] * self.weights['risk_tolerance']
-        )
+        composites = np.array([
+            assessment_results[category]['composite_score'] for category in self._CATEGORIES
+        ])
+        weighted_score = float(composites @ self._weight_vec)
         
-        if weighted_score >= 7.5:
-            recommendation = "SEPARATE_INSTANCE_STRONGLY_RECOMMENDED"
-            confidence = "HIGH"
-            rationale = "Multiple factors strongly favor separate instance deployment for operational independence and accelerated delivery."
-        elif weighted_score >= 6.0:
-            recommendation = "SEPARATE_INSTANCE_RECOMMENDED"  
-            confidence = "MEDIUM"
-            rationale = "Several factors favor separate instance approach, though some considerations may benefit from additional evaluation."
-        elif weighted_score >= 4.0:
-            recommendation = "HYBRID_EVALUATION_REQUIRED"
-            confidence = "MEDIUM"
-            rationale = "Mixed factors require detailed analysis of specific organizational priorities and constraints."
-        else:
-            recommendation = "ENTERPRISE_INTEGRATION_RECOMMENDED"
-            confidence = "MEDIUM"
-            rationale = "Current factors suggest enterprise integration approach may provide better alignment with organizational needs."
+        return self._overall_recommendation(weighted_score)
+    
+    def _overall_recommendation(self, weighted_score):
+        # Round off summation-order error so exact boundary scores band consistently
+        band = _score_band(round(weighted_score, 9))
+        recommendation, confidence, rationale = _OVERALL_OUTCOMES[band]
         
         return {
             'weighted_score': weighted_score,
@@ -196,75 +418,8 @@ class MigrationAssessment:
             'next_steps': self._get_next_steps(recommendation)
         }
     
-    def _get_org_recommendation(self, score):
-        if score >= 7.5:
-            return "High autonomy requirements strongly favor separate instance deployment"
-        elif score >= 6.0:
-            return "Moderate autonomy needs support separate instance consideration"
-        else:
-            return "Current autonomy requirements may be met through enterprise integration"
-    
-    def _get_tech_recommendation(self, score):
-        if score >= 7.5:
-            return "Technical factors strongly support simplified separate instance architecture"
-        elif score >= 6.0:
-            return "Technical complexity moderate - evaluate integration vs. independence trade-offs"
-        else:
-            return "Technical requirements may benefit from shared enterprise infrastructure"
-    
-    def _get_timeline_recommendation(self, score):
-        if score >= 7.5:
-            return "Critical timeline requirements strongly favor accelerated separate instance approach"
-        elif score >= 6.0:
-            return "Timeline considerations support separate instance for faster delivery"
-        else:
-            return "Timeline flexibility allows for coordinated enterprise implementation"
-    
-    def _get_resource_recommendation(self, score):
-        if score >= 7.5:
-            return "Strong resource availability enables dedicated separate instance implementation"
-        elif score >= 6.0:
-            return "Adequate resources available for separate instance approach"
-        else:
-            return "Resource constraints may benefit from shared enterprise approach"
-    
-    def _get_risk_recommendation(self, score):
-        if score >= 7.5:
-            return "Risk profile strongly supports independent implementation approach"
-        elif score >= 6.0:
-            return "Risk considerations favor separate instance for reduced dependencies"
-        else:
-            return "Risk tolerance may accommodate enterprise coordination requirements"
-    
     def _get_next_steps(self, recommendation):
-        steps = {
-            'SEPARATE_INSTANCE_STRONGLY_RECOMMENDED': [
-                "Proceed with separate instance architecture planning",
-                "Develop SOW amendment for scope redefinition",
-                "Create dedicated project timeline and resource plan",
-                "Establish independent vendor relationship framework"
-            ],
-            'SEPARATE_INSTANCE_RECOMMENDED': [
-                "Conduct detailed cost-benefit analysis comparing approaches", 
-                "Validate resource availability and timeline requirements",
-                "Develop risk mitigation strategies for independent implementation",
-                "Engage stakeholders for deployment approach confirmation"
-            ],
-            'HYBRID_EVALUATION_REQUIRED': [
-                "Perform detailed stakeholder requirements analysis",
-                "Conduct pilot evaluation of both approaches",
-                "Develop comparative implementation scenarios",
-                "Schedule decision workshop with key stakeholders"
-            ],
-            'ENTERPRISE_INTEGRATION_RECOMMENDED': [
-                "Develop enterprise integration timeline and coordination plan",
-                "Establish shared governance and decision-making framework", 
-                "Create multi-divisional communication and change management strategy",
-                "Define shared infrastructure requirements and dependencies"
-            ]
-        }
-        
-        return steps.get(recommendation, ["Contact IBM Champion community for guidance"])
+        return self._NEXT_STEPS.get(recommendation, self._DEFAULT_STEPS)
 
 def run_sample_assessment():
     """
@@ -308,54 +463,51 @@ def run_sample_assessment():
     # Run assessment
     assessment = MigrationAssessment()
     
-    results = {}
-    results['organizational'] = assessment.organizational_assessment(sample_responses['organizational'])
-    results['technical'] = assessment.technical_assessment(sample_responses['technical'])
-    results['timeline'] = assessment.timeline_assessment(sample_responses['timeline'])
-    results['resource'] = assessment.resource_assessment(sample_responses['resource'])
-    results['risk'] = assessment.risk_assessment(sample_responses['risk'])
-    
-    overall = assessment.calculate_overall_recommendation(results)
+    results, overall = assessment.assess_all(sample_responses)
     
     # Generate report
-    print("=" * 80)
-    print("MAXIMO MAS MIGRATION ASSESSMENT REPORT")
-    print("=" * 80)
-    print(f"Assessment Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Framework Version: 1.0")
-    print(f"Assessor: Migration Assessment Framework")
-    print()
-    
-    print("ASSESSMENT RESULTS BY CATEGORY:")
-    print("-" * 40)
+    report = [
+        "=" * 80,
+        "MAXIMO MAS MIGRATION ASSESSMENT REPORT",
+        "=" * 80,
+        f"Assessment Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "Framework Version: 1.0",
+        "Assessor: Migration Assessment Framework",
+        "",
+        "ASSESSMENT RESULTS BY CATEGORY:",
+        "-" * 40
+    ]
     
     for category, result in results.items():
-        print(f"\n{category.upper()} ASSESSMENT:")
-        print(f"  Composite Score: {result['composite_score']:.1f}/10")
-        print(f"  Recommendation: {result['recommendation']}")
-        
-        print("  Factor Breakdown:")
-        for factor, score in result['factors'].items():
-            print(f"    {factor}: {score}/10")
-    
-    print("\n" + "=" * 80)
-    print("OVERALL RECOMMENDATION:")
-    print("=" * 80)
-    print(f"Weighted Score: {overall['weighted_score']:.2f}/10")
-    print(f"Recommendation: {overall['recommendation']}")
-    print(f"Confidence Level: {overall['confidence']}")
-    print(f"\nRationale: {overall['rationale']}")
-    
-    print(f"\nRECOMMENDED NEXT STEPS:")
-    for i, step in enumerate(overall['next_steps'], 1):
-        print(f"  {i}. {step}")
-    
-    print("\n" + "=" * 80)
-    print("For detailed implementation guidance, see:")
-    print("  - Toronto Water Case Study (case-studies/toronto-water-success-story.md)")
-    print("  - SOW Amendment Templates (documentation/sow-amendment-templates/)")
-    print("  - Architecture Patterns (architecture-templates/separate-instance-architecture.md)")
-    print("=" * 80)
+        report.append(f"\n{category.upper()} ASSESSMENT:")
+        report.append(f"  Composite Score: {result['composite_score']:.1f}/10")
+        report.append(f"  Recommendation: {result['recommendation']}")
+        
+        report.append("  Factor Breakdown:")
+        report.extend(f"    {factor}: {score}/10" for factor, score in result['factors'].items())
+    
+    report += [
+        "\n" + "=" * 80,
+        "OVERALL RECOMMENDATION:",
+        "=" * 80,
+        f"Weighted Score: {overall['weighted_score']:.2f}/10",
+        f"Recommendation: {overall['recommendation']}",
+        f"Confidence Level: {overall['confidence']}",
+        f"\nRationale: {overall['rationale']}",
+        "\nRECOMMENDED NEXT STEPS:"
+    ]
+    report.extend(f"  {i}. {step}" for i, step in enumerate(overall['next_steps'], 1))
+    
+    report += [
+        "\n" + "=" * 80,
+        "For detailed implementation guidance, see:",
+        "  - Toronto Water Case Study (case-studies/toronto-water-success-story.md)",
+        "  - SOW Amendment Templates (documentation/sow-amendment-templates/)",
+        "  - Architecture Patterns (architecture-templates/separate-instance-architecture.md)",
+        "=" * 80
+    ]
+    
+    sys.stdout.write("\n".join(report) + "\n")
 
 if __name__ == "__main__":
     print("Maximo MAS Migration Assessment Framework")
@@ -0,0 +1,227 @@
+# Consistency checks for the Migration Readiness Assessment Framework
+# Run with: python -m unittest test_migration_assessment
+
+import importlib.util
+import unittest
+
+import numpy as np
+
+import migration_assessment as ma
+
+
+class BatchScoringTest(unittest.TestCase):
+    """
+    The Numba kernel, the NumPy fallback and the memoized scalar score()
+    path must agree, and bad input must be rejected before any kernel runs.
+    """
+
+    def setUp(self):
+        self.assessment = ma.MigrationAssessment()
+        self.responses = np.random.default_rng(0).integers(0, 11, (200, len(ma.ALL_KEYS))).astype(np.float64)
+        self.weights = self.assessment._weight_vec
+
+    def test_numpy_kernel_matches_scalar_score(self):
+        composites, weighted = ma._assess_kernel_numpy(self.responses, self.weights)
+        for row, composite, total in zip(self.responses, composites, weighted):
+            expected_composite, expected_total = self.assessment.score(row.tolist())
+            np.testing.assert_allclose(composite, expected_composite)
+            self.assertAlmostEqual(total, expected_total)
+
+    @unittest.skipIf(importlib.util.find_spec('numba') is None, "numba not installed")
+    def test_numba_kernel_matches_numpy_kernel(self):
+        kernel = ma._get_kernel()
+        self.assertIsNot(kernel, ma._assess_kernel_numpy)
+        composites, weighted = kernel(self.responses, self.weights)
+        expected_composites, expected_weighted = ma._assess_kernel_numpy(self.responses, self.weights)
+        np.testing.assert_allclose(composites, expected_composites)
+        np.testing.assert_allclose(weighted, expected_weighted)
+
+    def test_assess_many_matches_scalar_score(self):
+        composites, weighted = self.assessment.assess_many(self.responses)
+        for row, composite, total in zip(self.responses, composites, weighted):
+            expected_composite, expected_total = self.assessment.score(row.tolist())
+            np.testing.assert_allclose(composite, expected_composite)
+            self.assertAlmostEqual(total, expected_total)
+
+    def test_reweighted_instance_does_not_reuse_cached_scores(self):
+        responses = {
+            category: dict.fromkeys(keys, 9)
+            for category, keys in zip(self.assessment._CATEGORIES, self.assessment._CATEGORY_KEYS)
+        }
+        responses['technical'] = dict.fromkeys(ma.TECH_KEYS, 0)
+        
+        self.assessment.invalidate_cache()
+        _, default_overall = self.assessment.assess_all(responses)
+        
+        reweighted = ma.MigrationAssessment(weights={
+            'organizational_autonomy': 1.0,
+            'technical_complexity': 0.0,
+            'timeline_criticality': 0.0,
+            'resource_availability': 0.0,
+            'risk_tolerance': 0.0
+        })
+        results, overall = reweighted.assess_all(responses)
+        _, weighted = reweighted.assess_many(reweighted.response_vector(responses))
+        
+        self.assertEqual(ma._score.cache_info().hits, 0)
+        self.assertEqual(ma._score.cache_info().misses, 2)
+        self.assertAlmostEqual(default_overall['weighted_score'], 7.2)
+        self.assertAlmostEqual(overall['weighted_score'], 9.0)
+        self.assertAlmostEqual(reweighted.calculate_overall_recommendation(results)['weighted_score'], 9.0)
+        self.assertAlmostEqual(weighted[0], 9.0)
+
+    def test_assess_many_rejects_bad_response_shape(self):
+        with self.assertRaises(ValueError):
+            self.assessment.assess_many(np.ones((4, 10)))
+        with self.assertRaises(ValueError):
+            self.assessment.assess_many(np.ones((2, 2, len(ma.ALL_KEYS))))
+
+    def test_assess_many_rejects_bad_weight_shape(self):
+        with self.assertRaises(ValueError):
+            self.assessment.assess_many(self.responses, weights=[1, 1, 1])
+
+
+
+class ScoreBandTest(unittest.TestCase):
+    """
+    The threshold table must reproduce the original inclusive if/elif
+    ladders (>= 7.5, >= 6.0, >= 4.0), with NaN falling to the lowest band.
+    """
+
+    # Original ladder texts per category: (below 6.0, 6.0 to 7.5, 7.5 and up)
+    CATEGORY_TEXTS = {
+        'organizational': (
+            "Current autonomy requirements may be met through enterprise integration",
+            "Moderate autonomy needs support separate instance consideration",
+            "High autonomy requirements strongly favor separate instance deployment"
+        ),
+        'technical': (
+            "Technical requirements may benefit from shared enterprise infrastructure",
+            "Technical complexity moderate - evaluate integration vs. independence trade-offs",
+            "Technical factors strongly support simplified separate instance architecture"
+        ),
+        'timeline': (
+            "Timeline flexibility allows for coordinated enterprise implementation",
+            "Timeline considerations support separate instance for faster delivery",
+            "Critical timeline requirements strongly favor accelerated separate instance approach"
+        ),
+        'resource': (
+            "Resource constraints may benefit from shared enterprise approach",
+            "Adequate resources available for separate instance approach",
+            "Strong resource availability enables dedicated separate instance implementation"
+        ),
+        'risk': (
+            "Risk tolerance may accommodate enterprise coordination requirements",
+            "Risk considerations favor separate instance for reduced dependencies",
+            "Risk profile strongly supports independent implementation approach"
+        )
+    }
+
+    # (score, category ladder index, overall recommendation)
+    BOUNDARIES = (
+        (3.99, 0, "ENTERPRISE_INTEGRATION_RECOMMENDED"),
+        (4.0, 0, "HYBRID_EVALUATION_REQUIRED"),
+        (5.99, 0, "HYBRID_EVALUATION_REQUIRED"),
+        (6.0, 1, "SEPARATE_INSTANCE_RECOMMENDED"),
+        (7.49, 1, "SEPARATE_INSTANCE_RECOMMENDED"),
+        (7.5, 2, "SEPARATE_INSTANCE_STRONGLY_RECOMMENDED")
+    )
+
+    def setUp(self):
+        self.assessment = ma.MigrationAssessment()
+
+    def _category_recommendation(self, category, score):
+        keys = self.assessment._CATEGORY_KEYS[self.assessment._CATEGORIES.index(category)]
+        return getattr(self.assessment, f"{category}_assessment")(dict.fromkeys(keys, score))['recommendation']
+
+    def _overall(self, score):
+        results = {category: {'composite_score': score} for category in self.assessment._CATEGORIES}
+        return self.assessment.calculate_overall_recommendation(results)
+
+    def test_category_texts_at_boundaries(self):
+        for score, index, _ in self.BOUNDARIES:
+            for category, texts in self.CATEGORY_TEXTS.items():
+                with self.subTest(score=score, category=category):
+                    self.assertEqual(self._category_recommendation(category, score), texts[index])
+
+    def test_overall_outcomes_at_boundaries(self):
+        for score, _, expected in self.BOUNDARIES:
+            with self.subTest(score=score):
+                self.assertEqual(self._overall(score)['recommendation'], expected)
+
+    def test_nan_score_falls_to_lowest_band(self):
+        nan = float('nan')
+        self.assertEqual(ma._score_band(nan), 0)
+        for category, texts in self.CATEGORY_TEXTS.items():
+            with self.subTest(category=category):
+                self.assertEqual(self._category_recommendation(category, nan), texts[0])
+        overall = self._overall(nan)
+        self.assertEqual(overall['recommendation'], "ENTERPRISE_INTEGRATION_RECOMMENDED")
+        self.assertEqual(overall['confidence'], "MEDIUM")
+
+
+class WeightsTest(unittest.TestCase):
+    """
+    Constructor weight overrides merge into the defaults and drive the
+    weight vector; the resulting weights mapping is read-only.
+    """
+
+    def test_override_merges_into_weights_and_vector(self):
+        assessment = ma.MigrationAssessment(weights={'resource_availability': 0.5})
+        expected = dict(ma.MigrationAssessment.DEFAULT_WEIGHTS, resource_availability=0.5)
+        self.assertEqual(dict(assessment.weights), expected)
+        np.testing.assert_array_equal(
+            assessment._weight_vec,
+            [expected[key] for key in ma.MigrationAssessment._WEIGHT_KEYS]
+        )
+
+    def test_unknown_weight_key_raises(self):
+        with self.assertRaises(ValueError):
+            ma.MigrationAssessment(weights={'budget': 1.0})
+
+    def test_weights_are_read_only(self):
+        assessment = ma.MigrationAssessment()
+        with self.assertRaises(TypeError):
+            assessment.weights['risk_tolerance'] = 1.0
+
+
+def _responses(rows):
+    return {
+        category: dict(zip(keys, row))
+        for category, keys, row in zip(ma.MigrationAssessment._CATEGORIES, ma.MigrationAssessment._CATEGORY_KEYS, rows)
+    }
+
+
+class OverallRecommendationTest(unittest.TestCase):
+    """
+    Integer responses whose exact weighted score sits on a threshold must
+    land in the inclusive band regardless of floating-point summation order.
+    """
+
+    # Exactly 6.0 and 4.0, but the dot product rounds each just below
+    EXACT_SIX = ((10, 10, 10, 9), (5, 5, 6, 6), (8, 9, 8, 9), (2, 3, 3, 3), (1, 2, 2, 2))
+    EXACT_FOUR = ((8, 9, 1, 5), (10, 4, 1, 8), (0, 2, 0, 3), (5, 6, 3, 9), (3, 0, 3, 0))
+
+    def setUp(self):
+        self.assessment = ma.MigrationAssessment()
+
+    def test_calculate_overall_recommendation_at_exact_boundaries(self):
+        for rows, expected in ((self.EXACT_SIX, "SEPARATE_INSTANCE_RECOMMENDED"),
+                               (self.EXACT_FOUR, "HYBRID_EVALUATION_REQUIRED")):
+            responses = _responses(rows)
+            results = {
+                category: getattr(self.assessment, f"{category}_assessment")(responses[category])
+                for category in self.assessment._CATEGORIES
+            }
+            overall = self.assessment.calculate_overall_recommendation(results)
+            self.assertEqual(overall['recommendation'], expected)
+
+    def test_assess_all_at_exact_boundaries(self):
+        for rows, expected in ((self.EXACT_SIX, "SEPARATE_INSTANCE_RECOMMENDED"),
+                               (self.EXACT_FOUR, "HYBRID_EVALUATION_REQUIRED")):
+            _, overall = self.assessment.assess_all(_responses(rows))
+            self.assertEqual(overall['recommendation'], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()